@@ -24,6 +24,8 @@ class BoundingBox:
         height (int): The height of the box, equal to y1 - y0.
     """
 
+    __slots__ = ("x0", "x1", "y0", "y1")
+
     def __init__(self, x0: float, x1: float, y0: float, y1: float):
         if x1 < x0:
             raise InvalidCoordinatesError(
@@ -37,20 +39,24 @@ class BoundingBox:
         self.x1 = x1
         self.y0 = y0
         self.y1 = y1
-        self.width = x1 - x0
-        self.height = y1 - y0
+
+    @property
+    def width(self) -> float:
+        return self.x1 - self.x0
+
+    @property
+    def height(self) -> float:
+        return self.y1 - self.y0
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, BoundingBox):
             raise NotImplementedError(f"Can't compare BoundingBox with {type(other)}")
 
-        return all(
-            [
-                self.x0 == other.x0,
-                self.x1 == other.x1,
-                self.y0 == other.y0,
-                self.y1 == other.y1,
-            ]
+        return (
+            self.x0 == other.x0
+            and self.x1 == other.x1
+            and self.y0 == other.y0
+            and self.y1 == other.y1
         )
 
     def __repr__(self) -> str:
@@ -1,9 +1,21 @@
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 import re
-from collections import Counter, defaultdict
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from enum import Enum, auto
-from itertools import chain
+from itertools import accumulate
 
 from .common import BoundingBox
 from .exceptions import NoElementsOnPageError, PageNotFoundError
@@ -43,6 +55,57 @@ _ELEMENT_ORDERING_FUNCTIONS: Dict[ElementOrdering, Callable[[List], List]] = {
 }
 
 
+class _SpatialIndex:
+    """
+    An index of the bounding boxes of the elements on a single page, used to quickly
+    find candidate elements which may be partially within a given bounding box.
+
+    For each axis, we sort the elements by their lower coordinate and keep a running
+    maximum of their upper coordinates. Any element which overlaps the box along that
+    axis must then be in a contiguous slice of the sorted elements, which we find with
+    two binary searches. We use whichever axis gives the smaller slice.
+
+    Args:
+        elements (list[PDFElement]): The elements to index.
+    """
+
+    def __init__(self, elements: List["PDFElement"]):
+        by_x = sorted(elements, key=lambda elem: elem.bounding_box.x0)
+        self.__x_starts = [elem.bounding_box.x0 for elem in by_x]
+        self.__x_max_ends = list(
+            accumulate((elem.bounding_box.x1 for elem in by_x), max)
+        )
+        self.__x_indexes = [elem._index for elem in by_x]
+
+        by_y = sorted(elements, key=lambda elem: elem.bounding_box.y0)
+        self.__y_starts = [elem.bounding_box.y0 for elem in by_y]
+        self.__y_max_ends = list(
+            accumulate((elem.bounding_box.y1 for elem in by_y), max)
+        )
+        self.__y_indexes = [elem._index for elem in by_y]
+
+    def candidates(self, bounding_box: BoundingBox) -> List[int]:
+        """
+        Returns the indexes of elements which may be partially within the bounding box.
+
+        This is a superset of the elements which are partially within the bounding box,
+        and so each candidate should still be checked exactly.
+
+        Args:
+            bounding_box (BoundingBox): The bounding box to search within.
+
+        Returns:
+            list[int]: The indexes of the candidate elements.
+        """
+        x_start = bisect_left(self.__x_max_ends, bounding_box.x0)
+        x_end = bisect_right(self.__x_starts, bounding_box.x1)
+        y_start = bisect_left(self.__y_max_ends, bounding_box.y0)
+        y_end = bisect_right(self.__y_starts, bounding_box.y1)
+        if x_end - x_start <= y_end - y_start:
+            return self.__x_indexes[x_start:x_end]
+        return self.__y_indexes[y_start:y_end]
+
+
 class PDFPage:
     """
     A representation of a page within the `PDFDocument`.
@@ -60,12 +123,31 @@ class PDFPage:
         end_element (PDFElement): The last element on the page.
     """
 
+    __slots__ = (
+        "document",
+        "width",
+        "height",
+        "page_number",
+        "start_element",
+        "end_element",
+        "_start_index",
+        "_end_index",
+        "__element_indexes",
+    )
+
     document: "PDFDocument"
     width: int
     height: int
     page_number: int
     start_element: "PDFElement"
     end_element: "PDFElement"
+    # _start_index and _end_index are the indexes of start_element and end_element,
+    # stored directly since they are used every time we need the page's elements.
+    _start_index: int
+    _end_index: int
+    # __element_indexes will be a caching of the indexes of all elements on the page
+    # (including ignored elements), built the first time they are needed.
+    __element_indexes: Optional[FrozenSet[int]]
 
     def __init__(
         self,
@@ -82,6 +164,9 @@ class PDFPage:
         self.page_number = page_number
         self.start_element = start_element
         self.end_element = end_element
+        self._start_index = start_element._index
+        self._end_index = end_element._index
+        self.__element_indexes = None
 
     @property
     def elements(self) -> "ElementList":
@@ -91,9 +176,18 @@ class PDFPage:
         Returns:
             ElementList: All the elements on the page.
         """
-        return self.document.elements.between(
-            self.start_element, self.end_element, inclusive=True
-        )
+        return ElementList(self.document, self._element_indexes)
+
+    @property
+    def _element_indexes(self) -> FrozenSet[int]:
+        """
+        The indexes of all the elements on the page, including ignored elements.
+        """
+        if self.__element_indexes is None:
+            self.__element_indexes = frozenset(
+                range(self._start_index, self._end_index + 1)
+            )
+        return self.__element_indexes
 
 
 class PDFElement:
@@ -116,16 +210,35 @@ class PDFElement:
         bounding_box (BoundingBox): The box representing the location of the element.
     """
 
+    __slots__ = (
+        "document",
+        "original_element",
+        "_tags",
+        "bounding_box",
+        "_index",
+        "__font_name",
+        "__font_size",
+        "__font_size_precision",
+        "__font",
+        "__page_number",
+        "__text",
+        "__stripped_text",
+    )
+
     document: "PDFDocument"
     original_element: "LTComponent"
-    tags: Set[str]
+    # _tags will be None until the element is first tagged (or tags is accessed), as
+    # most elements are never tagged and an empty set for each would waste memory.
+    _tags: Optional[Set[str]]
     bounding_box: BoundingBox
     _index: int
-    __font_name: Optional[str] = None
-    __font_size: Optional[float] = None
+    __font_name: Optional[str]
+    __font_size: Optional[float]
     __font_size_precision: int
-    __font: Optional[str] = None
+    __font: Optional[str]
     __page_number: int
+    __text: Optional[str]
+    __stripped_text: Optional[str]
 
     def __init__(
         self,
@@ -140,12 +253,30 @@ class PDFElement:
         self._index = index
         self.__page_number = page_number
         self.__font_size_precision = font_size_precision
+        self.__font_name = None
+        self.__font_size = None
+        self.__font = None
+        self.__text = None
+        self.__stripped_text = None
+        self._tags = None
 
-        self.tags = set()
+        self.bounding_box = BoundingBox(element.x0, element.x1, element.y0, element.y1)
 
-        self.bounding_box = BoundingBox(
-            x0=element.x0, x1=element.x1, y0=element.y0, y1=element.y1
-        )
+    @property
+    def tags(self) -> Set[str]:
+        """
+        The tags that have been added to the element.
+
+        Returns:
+            set[str]: The tags of the element.
+        """
+        if self._tags is None:
+            self._tags = set()
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: Set[str]) -> None:
+        self._tags = tags
 
     @property
     def page_number(self) -> int:
@@ -168,18 +299,8 @@ class PDFElement:
         Returns:
             str: The font name of the element.
         """
-        if self.__font_name is not None:
-            return self.__font_name
-
-        counter = Counter(
-            (
-                character.fontname
-                for line in self.original_element
-                for character in line
-                if hasattr(character, "fontname")
-            )
-        )
-        self.__font_name = counter.most_common(1)[0][0]
+        if self.__font_name is None:
+            return self.__populate_font_info()[0]
         return self.__font_name
 
     @property
@@ -194,20 +315,8 @@ class PDFElement:
             float: The font size of the element, rounded to the font_size_precision of
                 the document.
         """
-        if self.__font_size is not None:
-            return self.__font_size
-
-        counter = Counter(
-            (
-                character.height
-                for line in self.original_element
-                for character in line
-                if hasattr(character, "height")
-            )
-        )
-        self.__font_size = round(
-            counter.most_common(1)[0][0], self.__font_size_precision
-        )
+        if self.__font_size is None:
+            return self.__populate_font_info()[1]
         return self.__font_size
 
     @property
@@ -228,13 +337,7 @@ class PDFElement:
         if self.__font is not None:
             return self.__font
 
-        font = f"{self.font_name},{self.font_size}"
-        if self.document._font_mapping_is_regex:
-            for pattern, font_name in self.document._font_mapping.items():
-                if re.match(pattern, font, self.document._regex_flags):
-                    self.__font = font_name
-                    return self.__font
-        self.__font = self.document._font_mapping.get(font) or font
+        self.__font = self.document._resolve_font(self.font_name, self.font_size)
         return self.__font
 
     @property
@@ -251,7 +354,10 @@ class PDFElement:
         Args:
             new_tag (str): The tag you would like to add.
         """
-        self.tags.add(new_tag)
+        if self._tags is None:
+            self._tags = {new_tag}
+        else:
+            self._tags.add(new_tag)
 
     def entirely_within(self, bounding_box: BoundingBox) -> bool:
         """
@@ -264,13 +370,12 @@ class PDFElement:
         Returns:
             bool: True if the element is entirely contained within the bounding box.
         """
-        return all(
-            [
-                self.bounding_box.x0 >= bounding_box.x0,
-                self.bounding_box.x1 <= bounding_box.x1,
-                self.bounding_box.y0 >= bounding_box.y0,
-                self.bounding_box.y1 <= bounding_box.y1,
-            ]
+        own_box = self.bounding_box
+        return (
+            own_box.x0 >= bounding_box.x0
+            and own_box.x1 <= bounding_box.x1
+            and own_box.y0 >= bounding_box.y0
+            and own_box.y1 <= bounding_box.y1
         )
 
     def ignore(self) -> None:
@@ -282,6 +387,7 @@ class PDFElement:
         `ElementList`, since doing so always returns a new `ElementList`.
         """
         self.document._ignored_indexes.add(self._index)
+        self.document._all_elements = None
 
     def partially_within(self, bounding_box: BoundingBox) -> bool:
         """
@@ -294,13 +400,12 @@ class PDFElement:
         Returns:
             bool: True if any part of the element is within the bounding box.
         """
-        return all(
-            [
-                bounding_box.x0 <= self.bounding_box.x1,
-                bounding_box.x1 >= self.bounding_box.x0,
-                bounding_box.y0 <= self.bounding_box.y1,
-                bounding_box.y1 >= self.bounding_box.y0,
-            ]
+        own_box = self.bounding_box
+        return (
+            bounding_box.x0 <= own_box.x1
+            and bounding_box.x1 >= own_box.x0
+            and bounding_box.y0 <= own_box.y1
+            and bounding_box.y1 >= own_box.y0
         )
 
     def text(self, stripped: bool = True) -> str:
@@ -314,12 +419,48 @@ class PDFElement:
         Returns:
             str: The text contained in the element.
         """
-        txt = self.original_element.get_text()
-        return txt.strip() if stripped else txt
+        if self.__text is None:
+            # get_text walks the PDF Miner layout tree each time, so we cache it.
+            self.__text = self.original_element.get_text()
+        if not stripped:
+            return self.__text
+        if self.__stripped_text is None:
+            # Text filters call this for every element, so cache the stripped copy too.
+            self.__stripped_text = self.__text.strip()
+        return self.__stripped_text
+
+    def __populate_font_info(self) -> Tuple[str, float]:
+        """
+        Sets both the font name and font size from a single walk over the characters
+        in the element, taking the most common value of each. If there is a tie, the
+        value seen first wins.
+
+        Returns:
+            tuple[str, float]: The font name and font size of the element.
+        """
+        font_name_counts: Dict[str, int] = {}
+        font_size_counts: Dict[float, int] = {}
+        for line in self.original_element:
+            for character in line:
+                if hasattr(character, "fontname"):
+                    font_name = character.fontname
+                    font_name_counts[font_name] = font_name_counts.get(font_name, 0) + 1
+                if hasattr(character, "height"):
+                    height = character.height
+                    font_size_counts[height] = font_size_counts.get(height, 0) + 1
+
+        # max returns the first maximal value, and dicts preserve insertion order, so
+        # ties are broken in the same way as Counter.most_common.
+        font_name = max(font_name_counts, key=font_name_counts.__getitem__)
+        height = max(font_size_counts, key=font_size_counts.__getitem__)
+        font_size = round(height, self.__font_size_precision)
+        self.__font_name = font_name
+        self.__font_size = font_size
+        return font_name, font_size
 
     def __repr__(self) -> str:
         return (
-            f"<PDFElement tags: {self.tags}, font: '{self.font}'"
+            f"<PDFElement tags: {self._tags or set()}, font: '{self.font}'"
             f"{', ignored' if self.ignored else ''}>"
         )
 
@@ -374,14 +515,29 @@ class PDFDocument:
     # (default left to right, top to bottom).
     _element_list: List[PDFElement]
     # _element_indexes_by_font will be a caching of fonts to elements indexes but it
-    # will be built as needed (while filtering by fonts), not on document load.
+    # will be built for all fonts the first time we filter by fonts, not on document
+    # load.
     _element_indexes_by_font: Dict[str, Set[int]]
+    # _spatial_index_by_page will be a caching of page numbers to an index of the
+    # element bounding boxes on that page, built as needed when filtering by location.
+    _spatial_index_by_page: Dict[int, _SpatialIndex]
     _ignored_indexes: Set[int]
+    # _all_elements will be a caching of the ElementList of all (non-ignored)
+    # elements. It is built when first needed, and reset whenever elements are ignored.
+    _all_elements: Optional["ElementList"]
     _font_mapping: Dict[str, str]
     _font_mapping_is_regex: bool
     _regex_flags: Union[int, re.RegexFlag]
+    _compiled_font_mapping: List[Tuple[Pattern, str]]
+    # _font_resolution_cache will be a caching of font names and sizes to their mapped
+    # fonts. There are usually only a handful of distinct fonts, so this saves
+    # formatting and matching every element's font against the font_mapping.
+    _font_resolution_cache: Dict[Tuple[str, float], str]
     _pdf_file_path: Optional[str]
     __pages: Dict[int, PDFPage]
+    # __sorted_pages will contain all pages, sorted by page number. Pages can't change
+    # after the document is loaded, so this is built once in __init__.
+    __sorted_pages: List[PDFPage]
 
     def __init__(
         self,
@@ -398,18 +554,29 @@ class PDFDocument:
         self.sectioning = Sectioning(self)
         self._element_list = []
         self._element_indexes_by_font = defaultdict(set)
+        self._spatial_index_by_page = {}
         self._font_mapping = font_mapping if font_mapping is not None else {}
         self._font_mapping_is_regex = font_mapping_is_regex
         self._regex_flags = regex_flags
+        self._compiled_font_mapping = (
+            [
+                (re.compile(pattern, regex_flags), mapped_font)
+                for pattern, mapped_font in self._font_mapping.items()
+            ]
+            if font_mapping_is_regex
+            else []
+        )
+        self._font_resolution_cache = {}
         self._ignored_indexes = set()
+        self._all_elements = None
         self.__pages = {}
+        if isinstance(element_ordering, ElementOrdering):
+            sort_func = _ELEMENT_ORDERING_FUNCTIONS[element_ordering]
+        else:
+            sort_func = element_ordering
         idx = 0
         for page_number, page in sorted(pages.items()):
             first_element = None
-            if isinstance(element_ordering, ElementOrdering):
-                sort_func = _ELEMENT_ORDERING_FUNCTIONS[element_ordering]
-            else:
-                sort_func = element_ordering
             for element in sort_func(page.elements):
                 pdf_element = PDFElement(
                     document=self,
@@ -439,7 +606,10 @@ class PDFDocument:
 
         self._pdf_file_path = pdf_file_path
         self.number_of_pages = len(pages)
-        self.page_numbers = [page.page_number for page in self.pages]
+        self.__sorted_pages = [
+            self.__pages[page_number] for page_number in sorted(self.__pages)
+        ]
+        self.page_numbers = [page.page_number for page in self.__sorted_pages]
 
     @property
     def elements(self) -> "ElementList":
@@ -449,7 +619,9 @@ class PDFDocument:
         Returns:
             ElementList: All elements in the document.
         """
-        return ElementList(self)
+        if self._all_elements is None:
+            self._all_elements = ElementList(self)
+        return self._all_elements
 
     @property
     def pages(self) -> List["PDFPage"]:
@@ -459,7 +631,8 @@ class PDFDocument:
         Returns:
             list[PDFPage]: All pages in the document.
         """
-        return [self.__pages[page_number] for page_number in sorted(self.__pages)]
+        # Copy the list so that callers can't modify the document's own list.
+        return list(self.__sorted_pages)
 
     @property
     def fonts(self) -> Set[str]:
@@ -489,6 +662,36 @@ class PDFDocument:
         except KeyError as err:
             raise PageNotFoundError(f"Could not find page {page_number}") from err
 
+    def _resolve_font(self, font_name: str, font_size: float) -> str:
+        """
+        Returns the font for the given font name and size after applying the
+        font_mapping.
+        For internal use only, used to cache the mapping of fonts. If you want the font
+        of an element you should use element.font instead.
+
+        Args:
+            font_name (str): The name of the font.
+            font_size (float): The size of the font.
+
+        Returns:
+            str: The mapped font, or the font name and size separated by a comma with no
+                spaces if it is not mapped.
+        """
+        key = (font_name, font_size)
+        if key in self._font_resolution_cache:
+            return self._font_resolution_cache[key]
+
+        font = f"{font_name},{font_size}"
+        resolved_font = self._font_mapping.get(font) or font
+        if self._font_mapping_is_regex:
+            for pattern, mapped_font in self._compiled_font_mapping:
+                if pattern.match(font):
+                    resolved_font = mapped_font
+                    break
+
+        self._font_resolution_cache[key] = resolved_font
+        return resolved_font
+
     def _element_indexes_with_fonts(self, *fonts: str) -> Set[int]:
         """
         Returns all the indexes of elements with given fonts.
@@ -501,25 +704,71 @@ class PDFDocument:
         Returns:
             Set[int]: The elements indexes.
         """
-        non_cached_fonts = [
-            font for font in fonts if font not in self._element_indexes_by_font.keys()
-        ]
-        if non_cached_fonts:
-            # If we don't have cached elements for any of the required fonts, build
-            # the cache for the non cached fonts.
+        cache = self._element_indexes_by_font
+        if not cache:
+            # Build the cache for every font in a single pass the first time we filter
+            # by font, rather than scanning all elements for each new font.
             for element in self._element_list:
-                if element.font not in non_cached_fonts:
-                    continue
+                cache[element.font].add(element._index)
+
+        # Returns elements based on the caching of fonts to elements indexes. Each
+        # distinct font is looked up once, and the union is done in a single call.
+        return set().union(*(cache[font] for font in set(fonts) if font in cache))
+
+    def _element_indexes_partially_within(
+        self, bounding_box: BoundingBox, page_number: int
+    ) -> Set[int]:
+        """
+        Returns all the indexes of elements on the given page which are partially
+        within the bounding box.
+        For internal use only, used to look up elements using the spatial index. If
+        you want to filter by location you should use
+        elements.filter_partially_within_bounding_box instead.
 
-                self._element_indexes_by_font[element.font].add(element._index)
+        Args:
+            bounding_box (BoundingBox): The bounding box to filter within.
+            page_number (int): The page to filter within.
 
-        # Returns elements based on the caching of fonts to elements indexes.
+        Returns:
+            Set[int]: The elements indexes.
+        """
         return set(
-            chain.from_iterable(
-                [
-                    indexes
-                    for font, indexes in self._element_indexes_by_font.items()
-                    if font in fonts
-                ]
-            )
+            index
+            for index in self.__get_spatial_index(page_number).candidates(bounding_box)
+            if self._element_list[index].partially_within(bounding_box)
         )
+
+    def _element_indexes_entirely_within(
+        self, bounding_box: BoundingBox, page_number: int
+    ) -> Set[int]:
+        """
+        Returns all the indexes of elements on the given page which are entirely
+        within the bounding box.
+        For internal use only, used to look up elements using the spatial index. If
+        you want to filter by location you should use
+        elements.filter_entirely_within_bounding_box instead.
+
+        Args:
+            bounding_box (BoundingBox): The bounding box to filter within.
+            page_number (int): The page to filter within.
+
+        Returns:
+            Set[int]: The elements indexes.
+        """
+        # Any element entirely within the box is also partially within it, so the
+        # candidates for partially within are also the candidates here.
+        return set(
+            index
+            for index in self.__get_spatial_index(page_number).candidates(bounding_box)
+            if self._element_list[index].entirely_within(bounding_box)
+        )
+
+    def __get_spatial_index(self, page_number: int) -> _SpatialIndex:
+        spatial_index = self._spatial_index_by_page.get(page_number)
+        if spatial_index is None:
+            page = self.get_page(page_number)
+            spatial_index = _SpatialIndex(
+                self._element_list[page._start_index : page._end_index + 1]
+            )
+            self._spatial_index_by_page[page_number] = spatial_index
+        return spatial_index
@@ -4,6 +4,7 @@ from typing import (
     FrozenSet,
     Iterable,
     Iterator,
+    List,
     Optional,
     Set,
     Union,
@@ -11,6 +12,7 @@ from typing import (
 )
 
 import re
+from operator import attrgetter
 
 from .common import BoundingBox
 from .exceptions import (
@@ -23,6 +25,10 @@ from .exceptions import (
 if TYPE_CHECKING:
     from .components import PDFDocument, PDFElement
 
+# _get_index returns the index of an element. Using attrgetter avoids calling a lambda
+# for every element when we only need the indexes.
+_get_index = attrgetter("_index")
+
 
 class ElementIterator(Iterator):
     index: int
@@ -31,7 +37,7 @@ class ElementIterator(Iterator):
     def __init__(self, element_list: "ElementList"):
         self.index = 0
         self.document = element_list.document
-        self.indexes = iter(sorted(element_list.indexes))
+        self.indexes = iter(element_list._sorted_indexes)
 
     def __next__(self) -> "PDFElement":
         index = next(self.indexes)
@@ -79,8 +85,13 @@ class ElementList(Iterable):
         indexes (set, optional): A frozenset of element indexes.
     """
 
+    __slots__ = ("document", "indexes", "__sorted_indexes")
+
     document: "PDFDocument"
     indexes: Union[Set[int], FrozenSet[int]]
+    # __sorted_indexes will be a caching of the indexes in document order, built the
+    # first time we need to iterate over or index into the list.
+    __sorted_indexes: Optional[List[int]]
 
     def __init__(
         self,
@@ -92,7 +103,9 @@ class ElementList(Iterable):
             self.indexes = frozenset(indexes)
         else:
             self.indexes = frozenset(range(0, len(document._element_list)))
-        self.indexes = self.indexes - self.document._ignored_indexes
+        if self.document._ignored_indexes:
+            self.indexes = self.indexes - self.document._ignored_indexes
+        self.__sorted_indexes = None
 
     def add_tag_to_elements(self, tag: str) -> None:
         """
@@ -101,7 +114,7 @@ class ElementList(Iterable):
         Args:
             tag (str): The tag you would like to add.
         """
-        for element in self:
+        for element in self.__unordered_elements():
             element.add_tag(tag)
 
     def filter(self, predicate: Callable[["PDFElement"], bool]) -> "ElementList":
@@ -116,7 +129,7 @@ class ElementList(Iterable):
             ElementList: The filtered list.
         """
 
-        new_indexes = set(element._index for element in self if predicate(element))
+        new_indexes = set(map(_get_index, filter(predicate, self)))
         return ElementList(self.document, new_indexes)
 
     def filter_by_tag(self, tag: str) -> "ElementList":
@@ -130,7 +143,7 @@ class ElementList(Iterable):
             ElementList: The filtered list.
         """
 
-        return self.filter(lambda e: tag in e.tags)
+        return self.__filter_unordered(lambda e: e._tags is not None and tag in e._tags)
 
     def filter_by_tags(self, *tags: str) -> "ElementList":
         """
@@ -143,7 +156,10 @@ class ElementList(Iterable):
             ElementList: The filtered list.
         """
 
-        return self.filter(lambda e: any(tag in e.tags for tag in tags))
+        tag_set = frozenset(tags)
+        return self.__filter_unordered(
+            lambda e: e._tags is not None and not tag_set.isdisjoint(e._tags)
+        )
 
     def filter_by_text_equal(self, text: str, stripped: bool = True) -> "ElementList":
         """
@@ -158,7 +174,7 @@ class ElementList(Iterable):
             ElementList: The filtered list.
         """
 
-        return self.filter(lambda e: e.text(stripped) == text)
+        return self.__filter_unordered(lambda e: e.text(stripped) == text)
 
     def filter_by_text_contains(self, text: str) -> "ElementList":
         """
@@ -171,7 +187,7 @@ class ElementList(Iterable):
             ElementList: The filtered list.
         """
 
-        return self.filter(lambda e: text in e.text())
+        return self.__filter_unordered(lambda e: text in e.text())
 
     def filter_by_regex(
         self,
@@ -192,10 +208,11 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
+        match = re.compile(regex, flags=regex_flags).match
         new_indexes = set(
             element._index
-            for element in self
-            if re.match(regex, element.text(stripped), flags=regex_flags)
+            for element in self.__unordered_elements()
+            if match(element.text(stripped))
         )
 
         return ElementList(self.document, new_indexes)
@@ -236,7 +253,7 @@ class ElementList(Iterable):
             ElementList: The filtered list.
         """
 
-        return self.filter(lambda e: e.font_size == font_size)
+        return self.__filter_unordered(lambda e: e.font_size == font_size)
 
     def filter_by_page(self, page_number: int) -> "ElementList":
         """
@@ -249,8 +266,7 @@ class ElementList(Iterable):
             ElementList: The filtered list.
         """
         page = self.document.get_page(page_number)
-        new_indexes = set(element._index for element in page.elements)
-        return self.__intersect_indexes_with_self(new_indexes)
+        return self.__intersect_indexes_with_self(page._element_indexes)
 
     def filter_by_pages(self, *page_numbers: int) -> "ElementList":
         """
@@ -262,10 +278,12 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
-        new_indexes: Set[int] = set()
-        for page_number in page_numbers:
-            page = self.document.get_page(page_number)
-            new_indexes |= set(element._index for element in page.elements)
+        new_indexes = set().union(
+            *(
+                self.document.get_page(page_number)._element_indexes
+                for page_number in page_numbers
+            )
+        )
         return self.__intersect_indexes_with_self(new_indexes)
 
     def filter_by_section_name(self, section_name: str) -> "ElementList":
@@ -280,9 +298,14 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
-        new_indexes: Set[int] = set()
-        for section in self.document.sectioning.get_sections_with_name(section_name):
-            new_indexes |= set(element._index for element in section.elements)
+        new_indexes = set().union(
+            *(
+                section._element_indexes
+                for section in self.document.sectioning.get_sections_with_name(
+                    section_name
+                )
+            )
+        )
         return self.__intersect_indexes_with_self(new_indexes)
 
     def filter_by_section_names(self, *section_names: str) -> "ElementList":
@@ -297,12 +320,15 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
-        new_indexes: Set[int] = set()
-        for section_name in section_names:
-            for section in self.document.sectioning.get_sections_with_name(
-                section_name
-            ):
-                new_indexes |= set(element._index for element in section.elements)
+        new_indexes = set().union(
+            *(
+                section._element_indexes
+                for section_name in section_names
+                for section in self.document.sectioning.get_sections_with_name(
+                    section_name
+                )
+            )
+        )
         return self.__intersect_indexes_with_self(new_indexes)
 
     def filter_by_section(self, section_str: str) -> "ElementList":
@@ -323,8 +349,7 @@ class ElementList(Iterable):
         """
         try:
             section = self.document.sectioning.get_section(section_str)
-            new_indexes = set(element._index for element in section.elements)
-            return self.__intersect_indexes_with_self(new_indexes)
+            return self.__intersect_indexes_with_self(section._element_indexes)
         except SectionNotFoundError:
             # Section doesn't exist - return empty ElementList.
             return self.__intersect_indexes_with_self(set())
@@ -349,7 +374,7 @@ class ElementList(Iterable):
         for section_str in section_strs:
             try:
                 section = self.document.sectioning.sections_dict[section_str]
-                new_indexes |= set(element._index for element in section.elements)
+                new_indexes |= section._element_indexes
             except SectionNotFoundError:
                 # This section doesn't exist. That's fine, keep checking the other ones.
                 pass
@@ -362,6 +387,7 @@ class ElementList(Iterable):
         self.document._ignored_indexes = self.document._ignored_indexes.union(
             self.indexes
         )
+        self.document._all_elements = None
 
     def to_the_right_of(
         self, element: "PDFElement", inclusive: bool = False, tolerance: float = 0.0
@@ -499,7 +525,11 @@ class ElementList(Iterable):
             0,
             element.bounding_box.y0,
         )
-        results = self.filter_partially_within_bounding_box(bounding_box, page_number)
+        # Collect the indexes from every page first so that we only build one
+        # ElementList at the end.
+        new_indexes = self.document._element_indexes_partially_within(
+            bounding_box, page_number
+        )
         if all_pages:
             for page in self.document.pages:
                 if page.page_number <= page_number:
@@ -512,12 +542,12 @@ class ElementList(Iterable):
                     0,
                     page.height,
                 )
-                results = results | self.filter_partially_within_bounding_box(
+                new_indexes |= self.document._element_indexes_partially_within(
                     bounding_box, page.page_number
                 )
         if not inclusive:
-            results = results.remove_element(element)
-        return results
+            new_indexes.discard(element._index)
+        return self.__intersect_indexes_with_self(new_indexes)
 
     def above(
         self,
@@ -567,7 +597,11 @@ class ElementList(Iterable):
             element.bounding_box.y1,
             page.height,
         )
-        results = self.filter_partially_within_bounding_box(bounding_box, page_number)
+        # Collect the indexes from every page first so that we only build one
+        # ElementList at the end.
+        new_indexes = self.document._element_indexes_partially_within(
+            bounding_box, page_number
+        )
         if all_pages:
             for page in self.document.pages:
                 if page.page_number >= page_number:
@@ -580,12 +614,12 @@ class ElementList(Iterable):
                     0,
                     page.height,
                 )
-                results = results | self.filter_partially_within_bounding_box(
+                new_indexes |= self.document._element_indexes_partially_within(
                     bounding_box, page.page_number
                 )
         if not inclusive:
-            results = results.remove_element(element)
-        return results
+            new_indexes.discard(element._index)
+        return self.__intersect_indexes_with_self(new_indexes)
 
     def vertically_in_line_with(
         self,
@@ -632,7 +666,11 @@ class ElementList(Iterable):
             0,
             page.height,
         )
-        results = self.filter_partially_within_bounding_box(bounding_box, page_number)
+        # Collect the indexes from every page first so that we only build one
+        # ElementList at the end.
+        new_indexes = self.document._element_indexes_partially_within(
+            bounding_box, page_number
+        )
         if all_pages:
             for page_num in range(self[0].page_number, self[-1].page_number + 1):
                 page = self.document.get_page(page_num)
@@ -645,13 +683,13 @@ class ElementList(Iterable):
                     0,
                     page.height,
                 )
-                results = results | self.filter_partially_within_bounding_box(
+                new_indexes |= self.document._element_indexes_partially_within(
                     bounding_box, page.page_number
                 )
 
         if not inclusive:
-            results = results.remove_element(element)
-        return results
+            new_indexes.discard(element._index)
+        return self.__intersect_indexes_with_self(new_indexes)
 
     def horizontally_in_line_with(
         self, element: "PDFElement", inclusive: bool = False, tolerance: float = 0.0
@@ -708,10 +746,27 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
-        new_indexes: Set[int] = set()
-        for elem in self.filter_by_page(page_number):
-            if elem.partially_within(bounding_box):
-                new_indexes.add(elem._index)
+        new_indexes = self.document._element_indexes_partially_within(
+            bounding_box, page_number
+        )
+        return self.__intersect_indexes_with_self(new_indexes)
+
+    def filter_entirely_within_bounding_box(
+        self, bounding_box: BoundingBox, page_number: int
+    ) -> "ElementList":
+        """
+        Returns all elements on the given page which are entirely within the given box.
+
+        Args:
+            bounding_box (BoundingBox): The bounding box to filter within.
+            page_number (int): The page which you'd like to filter within the box.
+
+        Returns:
+            ElementList: The filtered list.
+        """
+        new_indexes = self.document._element_indexes_entirely_within(
+            bounding_box, page_number
+        )
         return self.__intersect_indexes_with_self(new_indexes)
 
     def before(self, element: "PDFElement", inclusive: bool = False) -> "ElementList":
@@ -730,10 +785,13 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
-        new_indexes = set(range(0, element._index))
         if inclusive:
-            new_indexes.add(element._index)
-        return self.__intersect_indexes_with_self(new_indexes)
+            new_indexes = set(
+                index for index in self.indexes if index <= element._index
+            )
+        else:
+            new_indexes = set(index for index in self.indexes if index < element._index)
+        return ElementList(self.document, new_indexes)
 
     def after(self, element: "PDFElement", inclusive: bool = False) -> "ElementList":
         """
@@ -751,10 +809,13 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
-        new_indexes = set(range(element._index + 1, max(self.indexes) + 1))
         if inclusive:
-            new_indexes.add(element._index)
-        return self.__intersect_indexes_with_self(new_indexes)
+            new_indexes = set(
+                index for index in self.indexes if index >= element._index
+            )
+        else:
+            new_indexes = set(index for index in self.indexes if index > element._index)
+        return ElementList(self.document, new_indexes)
 
     def between(
         self,
@@ -781,10 +842,14 @@ class ElementList(Iterable):
         Returns:
             ElementList: The filtered list.
         """
-        new_indexes = set(range(start_element._index + 1, end_element._index))
+        start_index = start_element._index
+        end_index = end_element._index
+        new_indexes = set(
+            index for index in self.indexes if start_index < index < end_index
+        )
         if inclusive:
-            new_indexes = new_indexes.union([start_element._index, end_element._index])
-        return self.__intersect_indexes_with_self(new_indexes)
+            new_indexes |= self.indexes.intersection([start_index, end_index])
+        return ElementList(self.document, new_indexes)
 
     def extract_single_element(self) -> "PDFElement":
         """
@@ -808,7 +873,7 @@ class ElementList(Iterable):
                 f"There are {len(self.indexes)} elements in the ElementList"
             )
 
-        return self.first()
+        return self.document._element_list[next(iter(self.indexes))]
 
     def add_element(self, element: "PDFElement") -> "ElementList":
         """
@@ -838,9 +903,7 @@ class ElementList(Iterable):
         Returns:
             ElementList: A new list with the additional elements.
         """
-        return ElementList(
-            self.document, self.indexes | set([element._index for element in elements])
-        )
+        return ElementList(self.document, self.indexes | set(map(_get_index, elements)))
 
     def remove_element(self, element: "PDFElement") -> "ElementList":
         """
@@ -870,9 +933,7 @@ class ElementList(Iterable):
         Returns:
             ElementList: A new list without the elements.
         """
-        return ElementList(
-            self.document, self.indexes - set(element._index for element in elements)
-        )
+        return ElementList(self.document, self.indexes - set(map(_get_index, elements)))
 
     def move_forwards_from(
         self, element: "PDFElement", count: int = 1, capped: bool = False
@@ -896,7 +957,7 @@ class ElementList(Iterable):
                 that we reach the end (or start) of the list. Only happens when
                 capped=False.
         """
-        indexes = sorted(self.indexes)
+        indexes = self._sorted_indexes
         new_index = indexes.index(element._index) + count
         if new_index < 0 or new_index >= len(indexes):
             # Out of range. We could simply catch the index error for large new_index,
@@ -911,8 +972,6 @@ class ElementList(Iterable):
                 f"{'start' if new_index < 0 else 'end'} of the ElementList"
             )
 
-        # We avoid just returning self[new_index] here since getitem will do an
-        # additional sorted(self.indexes), which we have already computed here.
         element_index = indexes[new_index]
         return self.document._element_list[element_index]
 
@@ -957,7 +1016,7 @@ class ElementList(Iterable):
             ElementList: The filtered list without header elements.
         """
 
-        return self.filter(lambda e: e.bounding_box.y0 < bottom_of_header_y)
+        return self.__filter_unordered(lambda e: e.bounding_box.y0 < bottom_of_header_y)
 
     def filter_out_footer(self, top_of_footer_y: float) -> "ElementList":
         """
@@ -975,7 +1034,7 @@ class ElementList(Iterable):
             ElementList: The filtered list without footer elements.
         """
 
-        return self.filter(lambda e: e.bounding_box.y1 > top_of_footer_y)
+        return self.__filter_unordered(lambda e: e.bounding_box.y1 > top_of_footer_y)
 
     def first(self) -> "PDFElement":
         """
@@ -1009,8 +1068,46 @@ class ElementList(Iterable):
 
         return self[-1]
 
-    def __intersect_indexes_with_self(self, new_indexes: Set[int]) -> "ElementList":
-        return self & ElementList(self.document, new_indexes)
+    def __filter_unordered(
+        self, predicate: Callable[["PDFElement"], bool]
+    ) -> "ElementList":
+        """
+        As filter, but the predicate is called on the elements in no particular order,
+        which avoids sorting the indexes. This should only be used internally, with
+        predicates which have no side effects.
+
+        Args:
+            predicate (Callable[[PDFElement], bool]): The predicate to filter by.
+
+        Returns:
+            ElementList: The filtered list.
+        """
+        new_indexes = set(
+            map(_get_index, filter(predicate, self.__unordered_elements()))
+        )
+        return ElementList(self.document, new_indexes)
+
+    def __unordered_elements(self) -> Iterator["PDFElement"]:
+        """
+        Returns an iterator over the elements in the list in no particular order. This
+        avoids sorting the indexes when the order does not matter.
+        """
+        return map(self.document._element_list.__getitem__, self.indexes)
+
+    @property
+    def _sorted_indexes(self) -> List[int]:
+        """
+        The indexes of the elements in the list, in the order they appear in the
+        document.
+        """
+        if self.__sorted_indexes is None:
+            self.__sorted_indexes = sorted(self.indexes)
+        return self.__sorted_indexes
+
+    def __intersect_indexes_with_self(
+        self, new_indexes: Union[Set[int], FrozenSet[int]]
+    ) -> "ElementList":
+        return ElementList(self.document, self.indexes & new_indexes)
 
     def __iter__(self) -> ElementIterator:
         """
@@ -1047,9 +1144,9 @@ class ElementList(Iterable):
         left-to-right, top-to-bottom (the same you you read).
         """
         if isinstance(key, slice):
-            new_indexes = set(sorted(self.indexes)[key])
+            new_indexes = set(self._sorted_indexes[key])
             return ElementList(self.document, new_indexes)
-        element_index = sorted(self.indexes)[key]
+        element_index = self._sorted_indexes[key]
         return self.document._element_list[element_index]
 
     def __eq__(self, other: object) -> bool:
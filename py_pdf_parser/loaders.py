@@ -1,4 +1,4 @@
-from typing import IO, Any, Dict, List, NamedTuple, Optional
+from typing import IO, Any, Dict, Iterable, List, NamedTuple, Optional
 
 import logging
 
@@ -46,6 +46,7 @@ def load(
     pdf_file_path: Optional[str] = None,
     password: Optional[str] = None,
     la_params: Optional[Dict] = None,
+    page_numbers: Optional[Iterable[int]] = None,
     **kwargs: Any,
 ) -> PDFDocument:
     """
@@ -62,6 +63,11 @@ def load(
             https://pdfminersix.readthedocs.io/en/latest/reference/composable.html#laparams.
             Note that py_pdf_parser will re-order the elements it receives from PDFMiner
             so options relating to element ordering will have no effect.
+        page_numbers (iterable(int), optional): If given, only these pages will be
+            loaded. Page numbers start from 1. Since PDF Miner does not need to analyse
+            the layout of the other pages, this is much faster when you only need a
+            few pages of a large document. Page numbers which are not in the document
+            (including any below 1) are ignored. Default: None (load all pages).
         kwargs: Passed to `PDFDocument`. See the documentation for `PDFDocument`.
 
     Returns:
@@ -71,27 +77,64 @@ def load(
         la_params = {}
     la_params = {**DEFAULT_LA_PARAMS, **la_params}
 
+    # If all_texts=True then we may get some text from inside figures
+    all_texts = la_params.get("all_texts")
+
+    # PDF Miner's page numbers start from 0, whereas ours start from 1. Also, PDF
+    # Miner numbers the pages it returns sequentially, so when only loading some pages
+    # we need to keep track of which page is which ourselves. Pages are always returned
+    # in the order they appear in the document.
+    pdfminer_page_numbers = None
+    requested_page_numbers = None
+    if page_numbers is not None:
+        # page_numbers may be a generator, so only iterate over it once.
+        requested_page_numbers = sorted(
+            page_number for page_number in set(page_numbers) if page_number >= 1
+        )
+        pdfminer_page_numbers = {
+            page_number - 1 for page_number in requested_page_numbers
+        }
+        if not pdfminer_page_numbers:
+            # PDF Miner would load all pages if given no page numbers. Instead we ask
+            # for a page which can't exist, so that the file is still opened (and the
+            # password checked) but no pages are loaded.
+            pdfminer_page_numbers = {-1}
+
     pages: Dict[int, Page] = {}
-    for page in extract_pages(
-        pdf_file, laparams=LAParams(**la_params), password=password
+    for page_index, page in enumerate(
+        extract_pages(
+            pdf_file,
+            laparams=LAParams(**la_params),
+            password=password,
+            page_numbers=pdfminer_page_numbers,
+        )
     ):
-        elements = [element for element in page if isinstance(element, LTTextBox)]
-
-        # If all_texts=True then we may get some text from inside figures
-        if la_params.get("all_texts"):
-            figures = (element for element in page if isinstance(element, LTFigure))
-            for figure in figures:
-                elements += [
-                    element for element in figure if isinstance(element, LTTextBox)
-                ]
+        if requested_page_numbers is None:
+            page_number = page.pageid
+        else:
+            page_number = requested_page_numbers[page_index]
+
+        elements = []
+        figures = []
+        for element in page:
+            if isinstance(element, LTTextBox):
+                elements.append(element)
+            elif all_texts and isinstance(element, LTFigure):
+                figures.append(element)
+
+        # Text from inside figures comes after the text on the page itself.
+        for figure in figures:
+            elements.extend(
+                element for element in figure if isinstance(element, LTTextBox)
+            )
 
         if not elements:
             logger.warning(
-                f"No elements detected on page {page.pageid}, skipping this page."
+                f"No elements detected on page {page_number}, skipping this page."
             )
             continue
 
-        pages[page.pageid] = Page(
+        pages[page_number] = Page(
             width=page.width, height=page.height, elements=elements
         )
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, Generator, ValuesView
+from typing import TYPE_CHECKING, Dict, FrozenSet, Generator, Optional, ValuesView
 
 from collections import defaultdict
 
@@ -34,6 +34,9 @@ class Section:
     unique_name: str
     start_element: "PDFElement"
     end_element: "PDFElement"
+    # __element_indexes will be a caching of the indexes of all elements in the
+    # section (including ignored elements), built the first time they are needed.
+    __element_indexes: Optional[FrozenSet[int]]
 
     def __init__(
         self,
@@ -50,9 +53,13 @@ class Section:
         self.unique_name = unique_name
         self.start_element = start_element
         self.end_element = end_element
+        self.__element_indexes = None
 
     def __contains__(self, element: "PDFElement") -> bool:
-        return element in self.elements
+        return (
+            self.start_element._index <= element._index <= self.end_element._index
+            and not element.ignored
+        )
 
     @property
     def elements(self) -> "ElementList":
@@ -62,9 +69,18 @@ class Section:
         Returns:
             ElementList: All the elements in the section.
         """
-        return self.document.elements.between(
-            self.start_element, self.end_element, inclusive=True
-        )
+        return ElementList(self.document, self._element_indexes)
+
+    @property
+    def _element_indexes(self) -> FrozenSet[int]:
+        """
+        The indexes of all the elements in the section, including ignored elements.
+        """
+        if self.__element_indexes is None:
+            self.__element_indexes = frozenset(
+                range(self.start_element._index, self.end_element._index + 1)
+            )
+        return self.__element_indexes
 
     def __eq__(self, other: object) -> bool:
         """
@@ -73,14 +89,12 @@ class Section:
         """
         if not isinstance(other, Section):
             raise NotImplementedError(f"Can't compare Section with {type(other)}")
-        return all(
-            [
-                self.document == other.document,
-                self.unique_name == other.unique_name,
-                self.start_element == other.start_element,
-                self.end_element == other.end_element,
-                self.__class__ == other.__class__,
-            ]
+        return (
+            self.document == other.document
+            and self.unique_name == other.unique_name
+            and self.start_element == other.start_element
+            and self.end_element == other.end_element
+            and self.__class__ == other.__class__
         )
 
     def __len__(self) -> int:
@@ -172,10 +172,7 @@ class PDFVisualiser:
 
         # We'd like to draw greyed out rectangles around the ignored elements, but these
         # are excluded from ElementLists, so we need to do this manually.
-        page_indexes = set(
-            range(page.start_element._index, page.end_element._index + 1)
-        )
-        ignored_indexes_on_page = page_indexes & self.document._ignored_indexes
+        ignored_indexes_on_page = page._element_indexes & self.document._ignored_indexes
         for index in ignored_indexes_on_page:
             element = self.document._element_list[index]
             self.__plot_element(element, STYLES["ignored"])
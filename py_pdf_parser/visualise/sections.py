@@ -289,10 +289,7 @@ class SectionVisualiser:
             return
 
         # We want to include ignored elements for this bit.
-        page_indexes = set(
-            range(page.start_element._index, page.end_element._index + 1)
-        )
-        ignored_indexes_on_page = page_indexes & self.document._ignored_indexes
+        ignored_indexes_on_page = page._element_indexes & self.document._ignored_indexes
         self.all_elements = list(page.elements) + [
             self.document._element_list[index] for index in ignored_indexes_on_page
         ]
@@ -105,6 +105,13 @@ class TestPDFElement(BaseTestCase):
         self.assertEqual(element.text(), "test")
         self.assertEqual(element.text(stripped=False), " test ")
 
+        # The text should be cached, so we only get it from PDF Miner once
+        element.original_element.text = " changed "
+        self.assertEqual(element.text(), "test")
+        self.assertEqual(element.text(stripped=False), " test ")
+        # The stripped text should also be cached rather than stripped again
+        self.assertIs(element.text(), element.text())
+
     def test_add_tag(self):
         element = create_pdf_element()
         self.assertEqual(element.tags, set())
@@ -118,6 +125,11 @@ class TestPDFElement(BaseTestCase):
         element.add_tag("bar")
         self.assertEqual(element.tags, set(["foo", "bar"]))
 
+        # Tags added directly to the set should also be kept
+        element = create_pdf_element()
+        element.tags.add("baz")
+        self.assertEqual(element.tags, set(["baz"]))
+
     def test_repr(self):
         element = create_pdf_element(font_name="test_font", font_size=2)
         self.assertEqual(repr(element), "<PDFElement tags: set(), font: 'test_font,2'>")
@@ -277,6 +289,10 @@ class TestPDFDocument(BaseTestCase):
 
         self.assertEqual(document.pages, [pdf_page_1, pdf_page_2])
 
+        # Modifying the returned list should not affect the document
+        document.pages.pop()
+        self.assertEqual(document.pages, [pdf_page_1, pdf_page_2])
+
         self.assertEqual(
             document.elements, ElementList(document, set([0, 1, 2, 3, 4, 5, 6, 7]))
         )
@@ -339,3 +355,88 @@ class TestPDFDocument(BaseTestCase):
         self.assert_original_element_list_equal(
             [elem_1, elem_4, elem_2, elem_3], document.elements
         )
+
+    def test_element_indexes_partially_within(self):
+        #   wide_elem spans the whole page, the others are small and spread out.
+        wide_elem = FakePDFMinerTextElement(bounding_box=BoundingBox(0, 100, 80, 90))
+        left_elem = FakePDFMinerTextElement(bounding_box=BoundingBox(0.1, 0.3, 40, 50))
+        middle_elem = FakePDFMinerTextElement(bounding_box=BoundingBox(40, 60, 40, 50))
+        right_elem = FakePDFMinerTextElement(bounding_box=BoundingBox(80, 90, 40, 50))
+        bottom_elem = FakePDFMinerTextElement(bounding_box=BoundingBox(40, 60, 0, 10))
+        other_page_elem = FakePDFMinerTextElement(
+            bounding_box=BoundingBox(40, 60, 40, 50)
+        )
+        document = create_pdf_document(
+            elements={
+                1: [wide_elem, left_elem, middle_elem, right_elem, bottom_elem],
+                2: [other_page_elem],
+            }
+        )
+        elements = document.elements
+        pdf_wide_elem = self.extract_element_from_list(wide_elem, elements)
+        pdf_left_elem = self.extract_element_from_list(left_elem, elements)
+        pdf_middle_elem = self.extract_element_from_list(middle_elem, elements)
+        pdf_right_elem = self.extract_element_from_list(right_elem, elements)
+        pdf_bottom_elem = self.extract_element_from_list(bottom_elem, elements)
+        pdf_other_page_elem = self.extract_element_from_list(other_page_elem, elements)
+
+        # A box in the middle of the page, overlapping only the middle element
+        self.assertEqual(
+            document._element_indexes_partially_within(BoundingBox(45, 55, 45, 55), 1),
+            set([pdf_middle_elem._index]),
+        )
+
+        # A column through the middle of the page
+        self.assertEqual(
+            document._element_indexes_partially_within(BoundingBox(45, 55, 0, 100), 1),
+            set([pdf_wide_elem._index, pdf_middle_elem._index, pdf_bottom_elem._index]),
+        )
+
+        # A row through the middle of the page
+        self.assertEqual(
+            document._element_indexes_partially_within(BoundingBox(0, 100, 45, 55), 1),
+            set([pdf_left_elem._index, pdf_middle_elem._index, pdf_right_elem._index]),
+        )
+
+        # Boxes which only touch the edges of elements
+        self.assertEqual(
+            document._element_indexes_partially_within(BoundingBox(0.3, 1, 45, 55), 1),
+            set([pdf_left_elem._index]),
+        )
+        self.assertEqual(
+            document._element_indexes_partially_within(
+                BoundingBox(95, 100, 90, 100), 1
+            ),
+            set([pdf_wide_elem._index]),
+        )
+
+        # A box containing nothing
+        self.assertEqual(
+            document._element_indexes_partially_within(BoundingBox(1, 2, 20, 30), 1),
+            set(),
+        )
+
+        # Only elements on the given page are returned
+        self.assertEqual(
+            document._element_indexes_partially_within(BoundingBox(45, 55, 45, 55), 2),
+            set([pdf_other_page_elem._index]),
+        )
+
+    def test_font_resolution_is_cached(self):
+        document = create_pdf_document(
+            elements=[
+                FakePDFMinerTextElement(font_name="fake_font_1", font_size=10),
+                FakePDFMinerTextElement(font_name="fake_font_1", font_size=10),
+                FakePDFMinerTextElement(font_name="fake_font_2", font_size=10),
+            ],
+            font_mapping={r"^fake_font_1,\d+$": "large_text"},
+            font_mapping_is_regex=True,
+        )
+        self.assertEqual(
+            [element.font for element in document.elements],
+            ["large_text", "large_text", "fake_font_2,10"],
+        )
+        self.assertEqual(
+            document._font_resolution_cache,
+            {("fake_font_1", 10): "large_text", ("fake_font_2", 10): "fake_font_2,10"},
+        )
@@ -3,7 +3,7 @@ import re
 from mock import call, patch
 
 from py_pdf_parser.common import BoundingBox
-from py_pdf_parser.components import PDFDocument, PDFElement
+from py_pdf_parser.components import PDFDocument
 from py_pdf_parser.exceptions import (
     ElementOutOfRangeError,
     MultipleElementsFoundError,
@@ -16,6 +16,17 @@ from .base import BaseTestCase
 from .utils import FakePDFMinerTextElement, create_pdf_document
 
 
+def fake_element_indexes_partially_within(
+    document: PDFDocument, bounding_box: BoundingBox, page_number: int
+):
+    # Pretends the elements on the page with text "within" are within the bounding box.
+    return set(
+        element._index
+        for element in document.get_page(page_number).elements
+        if element.text() == "within"
+    )
+
+
 class TestFiltering(BaseTestCase):
     def setUp(self):
         self.elem1 = FakePDFMinerTextElement()
@@ -36,6 +47,8 @@ class TestFiltering(BaseTestCase):
 
     def test_ignored_elements_are_excluded(self):
         self.assertEqual(len(self.doc.elements), len(self.elem_list))
+        # The list of all elements should be cached until elements are ignored
+        self.assertIs(self.doc.elements, self.elem_list)
 
         self.elem_list[0].ignore()
         self.assertEqual(len(self.doc.elements), len(self.elem_list) - 1)
@@ -162,11 +175,13 @@ class TestFiltering(BaseTestCase):
         self.assertEqual(len(doc.elements.filter_by_font("hello,1")), 0)
 
         self.assertEqual(len(doc.elements.filter_by_font("foo,2")), 1)
-        # Check if "foo,2" has been added to cache
-        self.assertEqual(doc._element_indexes_by_font, {"foo,2": set([0])})
+        # Check the cache has been built for all fonts
+        self.assertEqual(
+            doc._element_indexes_by_font, {"foo,2": set([0]), "bar,3": set([1])}
+        )
         self.assert_original_element_in(elem1, doc.elements.filter_by_font("foo,2"))
 
-        # Check we can still filter for another font which is not in cache
+        # Check we can still filter for another font
         self.assertEqual(len(doc.elements.filter_by_font("bar,3")), 1)
         self.assertEqual(
             doc._element_indexes_by_font, {"foo,2": set([0]), "bar,3": set([1])}
@@ -178,8 +193,10 @@ class TestFiltering(BaseTestCase):
         self.assertEqual(len(doc.elements.filter_by_font("foo,2")), 0)
 
         self.assertEqual(len(doc.elements.filter_by_font("font_a")), 1)
-        # Check if "font_a" has been added to cache
-        self.assertEqual(doc._element_indexes_by_font, {"font_a": set([0])})
+        # Check the cache has been built for all fonts
+        self.assertEqual(
+            doc._element_indexes_by_font, {"font_a": set([0]), "bar,3": set([1])}
+        )
         self.assert_original_element_in(elem1, doc.elements.filter_by_font("font_a"))
 
     def test_filter_by_fonts(self):
@@ -191,9 +208,10 @@ class TestFiltering(BaseTestCase):
         self.assertEqual(len(doc.elements.filter_by_fonts("hello,1")), 0)
 
         self.assertEqual(len(doc.elements.filter_by_fonts("foo,2", "bar,3")), 2)
-        # Check if "foo,2" and "bar,3" have been added to cache
+        # Check the cache has been built for all fonts
         self.assertEqual(
-            doc._element_indexes_by_font, {"foo,2": set([0]), "bar,3": set([1])}
+            doc._element_indexes_by_font,
+            {"foo,2": set([0]), "bar,3": set([1]), "baz,3": set([2])},
         )
         self.assert_original_element_in(
             elem1, doc.elements.filter_by_fonts("foo,2", "bar,3")
@@ -210,9 +228,10 @@ class TestFiltering(BaseTestCase):
         self.assertEqual(len(doc.elements.filter_by_fonts("foo,2", "bar,3")), 0)
 
         self.assertEqual(len(doc.elements.filter_by_fonts("font_a", "font_b")), 2)
-        # Check if "font_a" and "font_b" have been added to cache
+        # Check the cache has been built for all fonts
         self.assertEqual(
-            doc._element_indexes_by_font, {"font_a": set([0]), "font_b": set([1])}
+            doc._element_indexes_by_font,
+            {"font_a": set([0]), "font_b": set([1]), "font_c": set([2])},
         )
         self.assert_original_element_in(
             elem1, doc.elements.filter_by_fonts("font_a", "font_b")
@@ -221,7 +240,7 @@ class TestFiltering(BaseTestCase):
             elem2, doc.elements.filter_by_fonts("font_a", "font_b")
         )
 
-        # Check we can still filter for another font which is not in cache
+        # Check we can still filter for another pair of fonts
         self.assertEqual(len(doc.elements.filter_by_fonts("font_b", "font_c")), 2)
         self.assert_original_element_in(
             elem2, doc.elements.filter_by_fonts("font_b", "font_c")
@@ -340,11 +359,9 @@ class TestFiltering(BaseTestCase):
         self.assertEqual(0, len(self.doc.elements))
         self.assertEqual(self.doc._ignored_indexes, set([0, 1, 2, 3, 4, 5]))
 
-    @patch.object(PDFElement, "partially_within", autospec=True)
+    @patch.object(PDFDocument, "_element_indexes_partially_within", autospec=True)
     def test_to_the_right_of(self, partially_within_mock):
-        partially_within_mock.side_effect = (
-            lambda self, bounding_box: self.text() == "within"
-        )
+        partially_within_mock.side_effect = fake_element_indexes_partially_within
 
         elem1 = FakePDFMinerTextElement(
             text="within", bounding_box=BoundingBox(50, 51, 50, 51)
@@ -363,22 +380,13 @@ class TestFiltering(BaseTestCase):
 
         pdf_elem1 = self.extract_element_from_list(elem1, elem_list)
         pdf_elem2 = self.extract_element_from_list(elem2, elem_list)
-        pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
         pdf_elem4 = self.extract_element_from_list(elem4, elem_list)
 
         result = elem_list.to_the_right_of(pdf_elem1)
 
         # expected_bbox is from the right edge of elem1 to the right edge of the page
         expected_bbox = BoundingBox(51, 100, 50, 51)
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         self.assertEqual(len(result), 2)
         self.assertIn(pdf_elem2, result)
@@ -388,15 +396,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.to_the_right_of(pdf_elem1, inclusive=True)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         self.assertEqual(len(result), 3)
         self.assertIn(pdf_elem1, result)
@@ -409,15 +409,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.to_the_right_of(pdf_elem1, tolerance=0.1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         # Test tolerance gets capped at half the height of the element
         expected_bbox = BoundingBox(51, 100, 50.5, 50.5)
@@ -425,21 +417,11 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.to_the_right_of(pdf_elem1, tolerance=1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
-    @patch.object(PDFElement, "partially_within", autospec=True)
+    @patch.object(PDFDocument, "_element_indexes_partially_within", autospec=True)
     def test_to_the_left_of(self, partially_within_mock):
-        partially_within_mock.side_effect = (
-            lambda self, bounding_box: self.text() == "within"
-        )
+        partially_within_mock.side_effect = fake_element_indexes_partially_within
 
         elem1 = FakePDFMinerTextElement(
             text="within", bounding_box=BoundingBox(50, 51, 50, 51)
@@ -458,22 +440,13 @@ class TestFiltering(BaseTestCase):
 
         pdf_elem1 = self.extract_element_from_list(elem1, elem_list)
         pdf_elem2 = self.extract_element_from_list(elem2, elem_list)
-        pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
         pdf_elem4 = self.extract_element_from_list(elem4, elem_list)
 
         result = elem_list.to_the_left_of(pdf_elem1)
 
         # expected_bbox is from the left edge of elem1 to the left edge of the page
         expected_bbox = BoundingBox(0, 50, 50, 51)
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         self.assertEqual(len(result), 2)
         self.assertIn(pdf_elem2, result)
@@ -483,15 +456,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.to_the_left_of(pdf_elem1, inclusive=True)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         self.assertEqual(len(result), 3)
         self.assertIn(pdf_elem1, result)
@@ -504,15 +469,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.to_the_left_of(pdf_elem1, tolerance=0.1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         # Test tolerance gets capped at half the height of the element
         expected_bbox = BoundingBox(0, 50, 50.5, 50.5)
@@ -520,21 +477,11 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.to_the_left_of(pdf_elem1, tolerance=1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
-    @patch.object(PDFElement, "partially_within", autospec=True)
+    @patch.object(PDFDocument, "_element_indexes_partially_within", autospec=True)
     def test_below(self, partially_within_mock):
-        partially_within_mock.side_effect = (
-            lambda self, bounding_box: self.text() == "within"
-        )
+        partially_within_mock.side_effect = fake_element_indexes_partially_within
 
         elem1 = FakePDFMinerTextElement(text="within")
         elem2 = FakePDFMinerTextElement()
@@ -556,24 +503,14 @@ class TestFiltering(BaseTestCase):
 
         pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
         pdf_elem4 = self.extract_element_from_list(elem4, elem_list)
-        pdf_elem5 = self.extract_element_from_list(elem5, elem_list)
         pdf_elem6 = self.extract_element_from_list(elem6, elem_list)
-        pdf_elem7 = self.extract_element_from_list(elem7, elem_list)
         pdf_elem8 = self.extract_element_from_list(elem8, elem_list)
 
         result = elem_list.below(pdf_elem3)
 
         # expected_bbox is from the left edge of elem1 to the left edge of the page
         expected_bbox = BoundingBox(50, 51, 0, 50)
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         self.assertEqual(len(result), 2)
         self.assertIn(pdf_elem4, result)
@@ -583,15 +520,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.below(pdf_elem3, inclusive=True)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         self.assertEqual(len(result), 3)
         self.assertIn(pdf_elem3, result)
@@ -604,12 +533,8 @@ class TestFiltering(BaseTestCase):
 
         partially_within_mock.assert_has_calls(
             [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-                call(pdf_elem7, BoundingBox(50, 51, 0, 100)),
-                call(pdf_elem8, BoundingBox(50, 51, 0, 100)),
+                call(doc, expected_bbox, 2),
+                call(doc, BoundingBox(50, 51, 0, 100), 3),
             ],
             any_order=True,
         )
@@ -625,15 +550,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.below(pdf_elem3, tolerance=0.1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         # Test tolerance gets capped at half the width of the element
         expected_bbox = BoundingBox(50.5, 50.5, 0, 50)
@@ -641,21 +558,11 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.below(pdf_elem3, tolerance=1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
-    @patch.object(PDFElement, "partially_within", autospec=True)
+    @patch.object(PDFDocument, "_element_indexes_partially_within", autospec=True)
     def test_above(self, partially_within_mock):
-        partially_within_mock.side_effect = (
-            lambda self, bounding_box: self.text() == "within"
-        )
+        partially_within_mock.side_effect = fake_element_indexes_partially_within
 
         elem1 = FakePDFMinerTextElement(text="within")
         elem2 = FakePDFMinerTextElement()
@@ -676,25 +583,15 @@ class TestFiltering(BaseTestCase):
         elem_list = doc.elements
 
         pdf_elem1 = self.extract_element_from_list(elem1, elem_list)
-        pdf_elem2 = self.extract_element_from_list(elem2, elem_list)
         pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
         pdf_elem4 = self.extract_element_from_list(elem4, elem_list)
-        pdf_elem5 = self.extract_element_from_list(elem5, elem_list)
         pdf_elem6 = self.extract_element_from_list(elem6, elem_list)
 
         result = elem_list.above(pdf_elem3)
 
         # expected_bbox is from the left edge of elem1 to the left edge of the page
         expected_bbox = BoundingBox(50, 51, 51, 100)
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         self.assertEqual(len(result), 2)
         self.assertIn(pdf_elem4, result)
@@ -704,15 +601,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.above(pdf_elem3, inclusive=True)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         self.assertEqual(len(result), 3)
         self.assertIn(pdf_elem3, result)
@@ -725,12 +614,8 @@ class TestFiltering(BaseTestCase):
 
         partially_within_mock.assert_has_calls(
             [
-                call(pdf_elem1, BoundingBox(50, 51, 0, 100)),
-                call(pdf_elem2, BoundingBox(50, 51, 0, 100)),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
+                call(doc, BoundingBox(50, 51, 0, 100), 1),
+                call(doc, expected_bbox, 2),
             ],
             any_order=True,
         )
@@ -746,15 +631,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.above(pdf_elem3, tolerance=0.1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         # Test tolerance gets capped at half the width of the element
         expected_bbox = BoundingBox(50.5, 50.5, 51, 100)
@@ -762,21 +639,11 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.above(pdf_elem3, tolerance=1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
-    @patch.object(PDFElement, "partially_within", autospec=True)
+    @patch.object(PDFDocument, "_element_indexes_partially_within", autospec=True)
     def test_vertically_in_line_with(self, partially_within_mock):
-        partially_within_mock.side_effect = (
-            lambda self, bounding_box: self.text() == "within"
-        )
+        partially_within_mock.side_effect = fake_element_indexes_partially_within
 
         elem1 = FakePDFMinerTextElement(text="within")
         elem2 = FakePDFMinerTextElement()
@@ -797,27 +664,16 @@ class TestFiltering(BaseTestCase):
         elem_list = doc.elements
 
         pdf_elem1 = self.extract_element_from_list(elem1, elem_list)
-        pdf_elem2 = self.extract_element_from_list(elem2, elem_list)
         pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
         pdf_elem4 = self.extract_element_from_list(elem4, elem_list)
-        pdf_elem5 = self.extract_element_from_list(elem5, elem_list)
         pdf_elem6 = self.extract_element_from_list(elem6, elem_list)
-        pdf_elem7 = self.extract_element_from_list(elem7, elem_list)
         pdf_elem8 = self.extract_element_from_list(elem8, elem_list)
 
         result = elem_list.vertically_in_line_with(pdf_elem3)
 
         # expected_bbox is from the left edge of elem1 to the left edge of the page
         expected_bbox = BoundingBox(50, 51, 0, 100)
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         self.assertEqual(len(result), 2)
         self.assertIn(pdf_elem4, result)
@@ -827,15 +683,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.vertically_in_line_with(pdf_elem3, inclusive=True)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         self.assertEqual(len(result), 3)
         self.assertIn(pdf_elem3, result)
@@ -848,14 +696,9 @@ class TestFiltering(BaseTestCase):
 
         partially_within_mock.assert_has_calls(
             [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-                call(pdf_elem7, expected_bbox),
-                call(pdf_elem8, expected_bbox),
+                call(doc, expected_bbox, 1),
+                call(doc, expected_bbox, 2),
+                call(doc, expected_bbox, 3),
             ],
             any_order=True,
         )
@@ -872,15 +715,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.vertically_in_line_with(pdf_elem3, tolerance=0.1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
         # Test tolerance gets capped at half the width of the element
         expected_bbox = BoundingBox(50.5, 50.5, 0, 100)
@@ -888,21 +723,11 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.vertically_in_line_with(pdf_elem3, tolerance=1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-                call(pdf_elem5, expected_bbox),
-                call(pdf_elem6, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 2)
 
-    @patch.object(PDFElement, "partially_within", autospec=True)
+    @patch.object(PDFDocument, "_element_indexes_partially_within", autospec=True)
     def test_horizontally_in_line_with(self, partially_within_mock):
-        partially_within_mock.side_effect = (
-            lambda self, bounding_box: self.text() == "within"
-        )
+        partially_within_mock.side_effect = fake_element_indexes_partially_within
 
         elem1 = FakePDFMinerTextElement(
             text="within", bounding_box=BoundingBox(50, 51, 50, 51)
@@ -921,22 +746,13 @@ class TestFiltering(BaseTestCase):
 
         pdf_elem1 = self.extract_element_from_list(elem1, elem_list)
         pdf_elem2 = self.extract_element_from_list(elem2, elem_list)
-        pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
         pdf_elem4 = self.extract_element_from_list(elem4, elem_list)
 
         result = elem_list.horizontally_in_line_with(pdf_elem1)
 
         # expected_bbox is from the left edge of elem1 to the left edge of the page
         expected_bbox = BoundingBox(0, 100, 50, 51)
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         self.assertEqual(len(result), 2)
         self.assertIn(pdf_elem2, result)
@@ -946,15 +762,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.horizontally_in_line_with(pdf_elem1, inclusive=True)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         self.assertEqual(len(result), 3)
         self.assertIn(pdf_elem1, result)
@@ -967,15 +775,7 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.horizontally_in_line_with(pdf_elem1, tolerance=0.1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         # Test tolerance gets capped at half the height of the element
         expected_bbox = BoundingBox(0, 100, 50.5, 50.5)
@@ -983,21 +783,11 @@ class TestFiltering(BaseTestCase):
         partially_within_mock.reset_mock()
         result = elem_list.horizontally_in_line_with(pdf_elem1, tolerance=1)
 
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
-    @patch.object(PDFElement, "partially_within", autospec=True)
+    @patch.object(PDFDocument, "_element_indexes_partially_within", autospec=True)
     def test_filter_partially_within_bounding_box(self, partially_within_mock):
-        partially_within_mock.side_effect = (
-            lambda self, bounding_box: self.text() == "within"
-        )
+        partially_within_mock.side_effect = fake_element_indexes_partially_within
 
         elem1 = FakePDFMinerTextElement(text="within")
         elem2 = FakePDFMinerTextElement(text="within")
@@ -1014,7 +804,6 @@ class TestFiltering(BaseTestCase):
 
         pdf_elem1 = self.extract_element_from_list(elem1, elem_list)
         pdf_elem2 = self.extract_element_from_list(elem2, elem_list)
-        pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
         pdf_elem4 = self.extract_element_from_list(elem4, elem_list)
 
         result = elem_list.filter_partially_within_bounding_box(
@@ -1023,21 +812,50 @@ class TestFiltering(BaseTestCase):
 
         # expected_bbox is from the left edge of elem1 to the left edge of the page
         expected_bbox = BoundingBox(0, 1, 0, 1)
-        partially_within_mock.assert_has_calls(
-            [
-                call(pdf_elem1, expected_bbox),
-                call(pdf_elem2, expected_bbox),
-                call(pdf_elem3, expected_bbox),
-                call(pdf_elem4, expected_bbox),
-            ],
-            any_order=True,
-        )
+        partially_within_mock.assert_called_once_with(doc, expected_bbox, 1)
 
         self.assertEqual(len(result), 3)
         self.assertIn(pdf_elem1, result)
         self.assertIn(pdf_elem2, result)
         self.assertIn(pdf_elem4, result)
 
+    def test_filter_entirely_within_bounding_box(self):
+        elem1 = FakePDFMinerTextElement(bounding_box=BoundingBox(0, 1, 0, 1))
+        elem2 = FakePDFMinerTextElement(bounding_box=BoundingBox(1, 2, 1, 2))
+        elem3 = FakePDFMinerTextElement(bounding_box=BoundingBox(2, 3, 2, 3))
+        elem4 = FakePDFMinerTextElement(bounding_box=BoundingBox(0, 1, 0, 1))
+
+        page1 = Page(elements=[elem1, elem2, elem3], width=100, height=100)
+        page2 = Page(elements=[elem4], width=100, height=100)
+
+        doc = PDFDocument(pages={1: page1, 2: page2})
+        elem_list = doc.elements
+
+        pdf_elem1 = self.extract_element_from_list(elem1, elem_list)
+        pdf_elem2 = self.extract_element_from_list(elem2, elem_list)
+        pdf_elem3 = self.extract_element_from_list(elem3, elem_list)
+
+        # elem3 is only partially within the box
+        result = elem_list.filter_entirely_within_bounding_box(
+            BoundingBox(0, 2.5, 0, 2.5), 1
+        )
+        self.assertEqual(len(result), 2)
+        self.assertIn(pdf_elem1, result)
+        self.assertIn(pdf_elem2, result)
+
+        result = elem_list.filter_entirely_within_bounding_box(
+            BoundingBox(0, 3, 0, 3), 1
+        )
+        self.assertEqual(len(result), 3)
+        self.assertIn(pdf_elem3, result)
+
+        # Only elements from the list are returned
+        result = elem_list.remove_element(
+            pdf_elem1
+        ).filter_entirely_within_bounding_box(BoundingBox(0, 2.5, 0, 2.5), 1)
+        self.assertEqual(len(result), 1)
+        self.assertIn(pdf_elem2, result)
+
     def test_before(self):
         result = self.elem_list.before(self.elem_list[2])
 
@@ -1225,6 +1043,11 @@ class TestFiltering(BaseTestCase):
         self.assertEqual(ElementList(doc, {0, 2, 4}), even_elems)
         self.assertEqual(ElementList(doc, {1, 3}), odd_elems)
 
+        # The predicate should be called on the elements in order
+        seen = []
+        doc.elements.filter(lambda e: seen.append(e) is None)
+        self.assertEqual(seen, list(doc.elements))
+
     def test_filter_by_font_size(self):
         elem1 = FakePDFMinerTextElement(font_name="foo", font_size=1)
         elem2 = FakePDFMinerTextElement(font_name="bar", font_size=2)
@@ -27,12 +27,50 @@ class LoadersTest(TestCase):
         with self.assertRaises(PDFPasswordIncorrect):
             load_file(file_path, password="wrong_password")
 
+        # The file should still be opened even when no pages are loaded
+        with self.assertRaises(PDFPasswordIncorrect):
+            load_file(file_path, password="wrong_password", page_numbers=[])
+
     def test_load(self):
         file_path = os.path.join(os.path.dirname(__file__), "data", "pdfs", "test.pdf")
         with open(file_path, "rb") as in_file:
             document = load(in_file)
         self.assertIsInstance(document, PDFDocument)
 
+    def test_load_page_numbers(self):
+        file_path = os.path.join(os.path.dirname(__file__), "data", "pdfs", "test.pdf")
+        with open(file_path, "rb") as in_file:
+            document = load(in_file, page_numbers=[2])
+        self.assertIsInstance(document, PDFDocument)
+        self.assertEqual(document.page_numbers, [2])
+
+        page_2_text = document.get_page(2).elements[0].text()
+        self.assertTrue(page_2_text.startswith("In in erat fermentum"))
+
+        document = load_file(file_path, page_numbers=[1, 2])
+        self.assertEqual(document.page_numbers, [1, 2])
+        self.assertTrue(
+            document.get_page(1).elements[0].text().startswith("Lorem ipsum")
+        )
+        self.assertEqual(document.get_page(2).elements[0].text(), page_2_text)
+
+        # Generators should work, even though we need to use the page numbers twice
+        document = load_file(file_path, page_numbers=(n for n in [2]))
+        self.assertEqual(document.page_numbers, [2])
+        self.assertEqual(document.get_page(2).elements[0].text(), page_2_text)
+
+        # Page numbers which are not in the document should be ignored
+        document = load_file(file_path, page_numbers=[0, -1, 2, 3])
+        self.assertEqual(document.page_numbers, [2])
+        self.assertEqual(document.get_page(2).elements[0].text(), page_2_text)
+
+        # No pages should be loaded if there are no (valid) page numbers
+        document = load_file(file_path, page_numbers=[])
+        self.assertEqual(document.page_numbers, [])
+        self.assertEqual(len(document.elements), 0)
+        document = load_file(file_path, page_numbers=[0])
+        self.assertEqual(document.page_numbers, [])
+
     def test_load_with_text_in_image(self):
         file_path = os.path.join(os.path.dirname(__file__), "data", "pdfs", "image.pdf")
         with open(file_path, "rb") as in_file:
@@ -26,6 +26,10 @@ class TestSection(BaseTestCase):
         self.assertIn(pdf_elem_2, section)
         self.assertNotIn(pdf_elem_3, section)
 
+        # Ignored elements should not be in the section
+        pdf_elem_2.ignore()
+        self.assertNotIn(pdf_elem_2, section)
+
     def test_eq(self):
         elem_1 = FakePDFMinerTextElement()
         elem_2 = FakePDFMinerTextElement()